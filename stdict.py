@@ -1,17 +1,161 @@
+import asyncio
+import functools
 import json
+import logging
 import os
+import re
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import Annotated, Literal, NamedTuple, get_args
+from urllib.parse import quote, urlencode
 
+import httpx
 import mcp.types as types
-import requests
 from mcp.server.fastmcp import FastMCP
+from pydantic import Field
 
-mcp = FastMCP("stdict")
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# The key query parameter in a request URL
+_API_KEY_PARAM = re.compile(r"([?&]key=)[^&\s\"']*")
+
+
+class _RedactApiKey(logging.Filter):
+    """Mask the API key in request URLs that httpx logs"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        message = record.getMessage()
+        if "key=" in message:
+            record.msg = _API_KEY_PARAM.sub(r"\1***", message)
+            record.args = ()
+        return True
+
+
+# httpx logs every request URL at INFO, and the URL carries the API key. Keep those records
+# out of the server log, and mask the key should anyone turn them back on.
+_httpx_logger = logging.getLogger("httpx")
+_httpx_logger.setLevel(logging.WARNING)
+_httpx_logger.addFilter(_RedactApiKey())
 
 SEARCH_API_URL = "https://stdict.korean.go.kr/api/search.do"
 VIEW_API_URL = "https://stdict.korean.go.kr/api/view.do"
 
+# The type_search value each endpoint expects
+_TYPE_SEARCH = {SEARCH_API_URL: "search", VIEW_API_URL: "view"}
+
+# Argument types FastMCP validates before a tool runs, so bad values never reach the API
+ReqType = Literal["json", "xml"]
+SearchMethod = Literal["exact", "include", "start", "end", "wildcard"]
+DetailMethod = Literal["word_info", "target_code"]
+Start = Annotated[int, Field(ge=1, le=1000)]
+Num = Annotated[int, Field(ge=10, le=100)]
+Target = Annotated[int, Field(ge=1, le=11)]
+
+_VALID_METHODS = frozenset(get_args(DetailMethod))
+_VALID_REQ_TYPES = frozenset(get_args(ReqType))
+
+# Fixed error results, built once and returned as-is
+_ERR_BAD_METHOD = (types.TextContent(type="text", text="Error: Invalid method value. Must be 'word_info' or 'target_code'"),)
+_ERR_BAD_REQ_TYPE = (types.TextContent(type="text", text="Error: Invalid req_type value. Must be 'json' or 'xml'"),)
+
+# Shared client so every tool call reuses the same keep-alive connection pool. HTTP/2 lets
+# the bulk tools multiplex their requests over a single connection. Created on first use
+# and closed when the last server session ends.
+_client: httpx.AsyncClient | None = None
+_sessions = 0
+
+
+class _CachedResponse(NamedTuple):
+    """A stored API response with what is needed to serve or revalidate it"""
+    expires_at: float
+    freshness: float
+    etag: str | None
+    last_modified: str | None
+    text: str
+
+
+# Earlier responses, keyed on the request URL without the API key. Fresh entries are served
+# without a request, stale ones are revalidated. Freshness follows Cache-Control, defaulting
+# to _RESPONSE_TTL when the server gives none. API error bodies are never stored. The cache
+# is bounded by the total length of the stored bodies.
+_RESPONSE_TTL = 3600.0
+_RESPONSE_CACHE_MAX_CHARS = 64 * 1024 * 1024
+_response_cache: OrderedDict[str, _CachedResponse] = OrderedDict()
+_response_cache_chars = 0
+
+# Marks a body that isn't JSON, since None is a valid JSON value
+_NOT_JSON = object()
+
+# An XML body whose root element is <error>
+_XML_ERROR_ROOT = re.compile(r"\s*(?:<\?xml[^>]*\?>\s*)?<error[\s/>]")
+
+# Requests currently in flight, keyed on (API key, cache key), so concurrent identical
+# calls wait on the same request instead of sending their own. The API key is part of the
+# key because an error response for one key must not reach callers using another.
+_inflight: dict[tuple[str, str], asyncio.Task] = {}
+
+# Transient server errors are retried this many times, waiting _RETRY_BACKOFF * 2**attempt
+# seconds in between. Connection failures are retried by the transport itself.
+_RETRY_STATUSES = frozenset((500, 502, 503, 504))
+_RETRIES = 3
+_RETRY_BACKOFF = 0.2
+
+# Caps how many requests the bulk tools keep in flight at once
+_BULK_CONCURRENCY = 20
+_bulk_semaphore = asyncio.Semaphore(_BULK_CONCURRENCY)
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client, creating it if it doesn't exist or was closed"""
+    global _client
+
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=httpx.Timeout(10.0, connect=3.05),
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                retries=3,
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=20,
+                    keepalive_expiry=30.0,
+                ),
+            ),
+        )
+    return _client
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    """Close the shared HTTP client once the last server session ends"""
+    # SSE enters the lifespan once per connection, so only the last one out closes the client
+    global _sessions
+
+    _sessions += 1
+    try:
+        yield
+    finally:
+        _sessions -= 1
+        if _sessions == 0 and _client is not None:
+            await _client.aclose()
 
+
+mcp = FastMCP("stdict", lifespan=lifespan)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_desktop_config(path: str, mtime: float) -> dict:
+    # mtime is part of the cache key so an edited config is read again
+    data = Path(path).read_bytes()
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+@functools.lru_cache(maxsize=1)
 def get_api_key():
     # First try environment variable
     api_key = os.environ.get("STDICT_API_KEY")
@@ -20,35 +164,239 @@ def get_api_key():
 
     # Then try Claude desktop config
     config_path = Path.home() / "Library/Application Support/Claude/claude_desktop_config.json"
-    if config_path.exists():
-        try:
-            with open(config_path) as f:
-                config = json.load(f)
-                if "mcpServers" in config and "stdict" in config["mcpServers"]:
-                    env = config["mcpServers"]["stdict"].get("env", {})
-                    if "STDICT_API_KEY" in env:
-                        return env["STDICT_API_KEY"]
-        except:
-            pass
+    try:
+        config = _load_desktop_config(str(config_path), config_path.stat().st_mtime)
+        if "mcpServers" in config and "stdict" in config["mcpServers"]:
+            env = config["mcpServers"]["stdict"].get("env", {})
+            if "STDICT_API_KEY" in env:
+                return env["STDICT_API_KEY"]
+    except (OSError, ValueError, AttributeError, TypeError):
+        # Missing, unreadable, undecodable or oddly shaped configs all mean "no key here"
+        pass
 
     raise ValueError(
         "API key not found. Please set the STDICT_API_KEY environment variable or configure it in Claude desktop config."
     )
 
 
-API_KEY = get_api_key()
+def _drop_response(cache_key: str):
+    """Remove a response from the cache, if it is there"""
+    global _response_cache_chars
+
+    previous = _response_cache.pop(cache_key, None)
+    if previous is not None:
+        _response_cache_chars -= len(previous.text)
+
+
+def _cache_response(cache_key: str, entry: _CachedResponse):
+    """Store a response, evicting the least recently used ones past the size cap"""
+    global _response_cache_chars
+
+    _drop_response(cache_key)
+    _response_cache[cache_key] = entry
+    _response_cache_chars += len(entry.text)
+    while _response_cache_chars > _RESPONSE_CACHE_MAX_CHARS and _response_cache:
+        _, evicted = _response_cache.popitem(last=False)
+        _response_cache_chars -= len(evicted.text)
+
+
+def _parse_json(text: str):
+    """Parse a JSON body, returning _NOT_JSON if it doesn't parse"""
+    try:
+        return orjson.loads(text) if orjson else json.loads(text)
+    except ValueError:
+        return _NOT_JSON
+
+
+def _dump_json(payload) -> str:
+    """Serialize a parsed JSON body without whitespace"""
+    if orjson:
+        return orjson.dumps(payload).decode("utf-8")
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+
+
+def _is_api_error(text: str, payload) -> bool:
+    """Check for the error body the API sends, with status 200, for bad keys, exhausted quotas etc."""
+    if payload is not _NOT_JSON:
+        return isinstance(payload, dict) and "error" in payload
+    return _XML_ERROR_ROOT.match(text) is not None
+
+
+def _freshness(cache_control: str) -> float | None:
+    """
+    Work out how long a response may be served without revalidating it
+
+    Args:
+        cache_control: The response's Cache-Control header
+
+    Returns:
+        The freshness lifetime in seconds, or None if the response must not be stored
+    """
+    directives = {}
+    for directive in cache_control.split(","):
+        name, _, value = directive.strip().partition("=")
+        directives[name.lower()] = value.strip('"')
+
+    # The cache is shared between API keys, so private responses are treated like no-store
+    if "no-store" in directives or "private" in directives:
+        return None
+    if "no-cache" in directives:
+        return 0.0
+    if "max-age" in directives:
+        try:
+            return max(0.0, float(int(directives["max-age"])))
+        except ValueError:
+            return 0.0
+    return _RESPONSE_TTL
+
+
+@functools.lru_cache(maxsize=16)
+def _url_prefix(url: str, api_key: str) -> str:
+    """Build the fixed start of a request URL, so the key is only percent-encoded once"""
+    return f"{url}?key={quote(api_key, safe='')}&type_search={_TYPE_SEARCH[url]}&"
+
+
+async def _send(request_url: str, headers: dict[str, str]) -> httpx.Response:
+    """
+    Send a streaming GET request, retrying transient server errors with exponential backoff
+
+    Args:
+        request_url: The full request URL, including the API key
+        headers: Extra request headers
+
+    Returns:
+        The response, with its body not yet read; the caller must close it
+    """
+    client = _get_client()
+    for attempt in range(_RETRIES):
+        response = await client.send(client.build_request("GET", request_url, headers=headers), stream=True)
+        if response.status_code not in _RETRY_STATUSES:
+            return response
+        await response.aclose()
+        await asyncio.sleep(_RETRY_BACKOFF * 2 ** attempt)
+
+    return await client.send(client.build_request("GET", request_url, headers=headers), stream=True)
+
+
+async def _fetch(request_url: str, cache_key: str, compact_json: bool) -> str:
+    """
+    Request a dictionary API URL, revalidating a cached response with ETag / Last-Modified
+
+    Args:
+        request_url: The full request URL, including the API key
+        cache_key: The request URL without the API key
+        compact_json: Whether the body is JSON to compact before caching
+
+    Returns:
+        The response body as text
+    """
+    cached = _response_cache.get(cache_key)
+
+    headers = {}
+    if cached is not None:
+        if cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+
+    response = await _send(request_url, headers)
+    try:
+        cache_control = response.headers.get("Cache-Control")
+        freshness = _freshness(cache_control or "")
+        if response.status_code == 304 and cached is not None:
+            # A 304 without Cache-Control keeps the stored response's directives
+            if cache_control is None:
+                freshness = cached.freshness
+            if freshness is None:
+                _drop_response(cache_key)
+            else:
+                _cache_response(cache_key, cached._replace(
+                    expires_at=time.monotonic() + freshness,
+                    freshness=freshness,
+                    etag=response.headers.get("ETag", cached.etag),
+                    last_modified=response.headers.get("Last-Modified", cached.last_modified),
+                ))
+            return cached.text
+        response.raise_for_status()
+
+        body = bytearray()
+        async for chunk in response.aiter_bytes(65536):
+            body.extend(chunk)
+    finally:
+        await response.aclose()
+
+    # The API always answers in UTF-8, so skip charset detection
+    text = body.decode("utf-8")
+
+    # Pretty-printed JSON is compacted once here rather than shipped as-is to every caller
+    payload = _NOT_JSON
+    if compact_json:
+        payload = _parse_json(text)
+        if payload is not _NOT_JSON:
+            text = _dump_json(payload)
+
+    # Error bodies depend on the caller's key, so they must never be shared through the cache
+    if _is_api_error(text, payload):
+        _drop_response(cache_key)
+        return text
+
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if freshness is None or not (freshness or etag or last_modified):
+        # Nothing to serve it fresh for and nothing to revalidate it with
+        _drop_response(cache_key)
+    else:
+        _cache_response(cache_key, _CachedResponse(
+            time.monotonic() + freshness, freshness, etag, last_modified, text
+        ))
+
+    return text
+
+
+async def _get(url: str, api_key: str, params: list[tuple[str, object]]) -> str:
+    """
+    Fetch a dictionary API response, reusing recent responses and sharing one request
+    between concurrent identical calls
+
+    Args:
+        url: The API endpoint
+        api_key: The API key
+        params: The query parameters as (name, value) pairs, other than key and type_search
+
+    Returns:
+        The response body as text
+    """
+    # Encode the query once; without the key it doubles as the cache key
+    query = urlencode(params, quote_via=quote)
+    cache_key = f"{url}?{query}"
+
+    cached = _response_cache.get(cache_key)
+    if cached is not None and time.monotonic() < cached.expires_at:
+        _response_cache.move_to_end(cache_key)
+        return cached.text
+
+    inflight_key = (api_key, cache_key)
+    task = _inflight.get(inflight_key)
+    if task is None:
+        request_url = _url_prefix(url, api_key) + query
+        task = asyncio.create_task(_fetch(request_url, cache_key, ("req_type", "json") in params))
+        _inflight[inflight_key] = task
+        task.add_done_callback(lambda _: _inflight.pop(inflight_key, None))
+
+    # Shielded so one caller giving up doesn't cancel the request for the others
+    return await asyncio.shield(task)
 
 
 @mcp.tool()
-def search(
+async def search(
     query: str,
-    api_key: str = API_KEY,
-    req_type: str = "json",
-    start: int = 1,
-    num: int = 10,
+    api_key: str | None = None,
+    req_type: ReqType = "json",
+    start: Start = 1,
+    num: Num = 10,
     advanced: bool = False,
-    target: int = 1,
-    method: str = "exact",
+    target: Target = 1,
+    method: SearchMethod = "exact",
     type1: str = "all",
     type2: str = "all",
     pos: str = "0",
@@ -58,7 +406,7 @@ def search(
     letter_e: int = 1,
     update_s: str = None,
     update_e: str = None
-) -> list[types.TextContent | types.ImageContent]:
+) -> tuple[types.TextContent, ...]:
     """
     Search the Dictionary
 
@@ -390,46 +738,45 @@ def search(
             </tbody>
         </table>
     """
-    params = {
-        "key": api_key,
-        "q": query,
-        "req_type": req_type,
-        "start": start,
-        "num": num,
-        "advanced": "y" if advanced else "n",
-        "type_search": "search"
-    }
+    # Resolve the key on first use rather than at import
+    if api_key is None:
+        api_key = get_api_key()
+
+    params = [
+        ("q", query),
+        ("req_type", req_type),
+        ("start", start),
+        ("num", num),
+        ("advanced", "y" if advanced else "n"),
+    ]
 
     if advanced:
-        advanced_params = {
-            "target": target,
-            "method": method,
-            "type1": type1,
-            "type2": type2,
-            "pos": pos,
-            "cat": cat,
-            "multimedia": multimedia,
-            "letter_s": letter_s,
-            "letter_e": letter_e,
-        }
+        params.extend((
+            ("target", target),
+            ("method", method),
+            ("type1", type1),
+            ("type2", type2),
+            ("pos", pos),
+            ("cat", cat),
+            ("multimedia", multimedia),
+            ("letter_s", letter_s),
+            ("letter_e", letter_e),
+        ))
 
         # Only add date parameters if they're provided
         if update_s:
-            advanced_params["update_s"] = update_s
+            params.append(("update_s", update_s))
         if update_e:
-            advanced_params["update_e"] = update_e
-
-        params.update(advanced_params)
+            params.append(("update_e", update_e))
 
     try:
-        response = requests.get(SEARCH_API_URL, params=params)
-        response.raise_for_status()
+        text = await _get(SEARCH_API_URL, api_key, params)
 
-        # Return the original XML response as text
-        return [types.TextContent(type="text", text=response.text)]
+        # Return the response body; JSON bodies come back re-serialized without whitespace
+        return (types.TextContent(type="text", text=text),)
 
     except Exception as e:
-        return [types.TextContent(type="text", text=f"Error: {str(e)}")]
+        return (types.TextContent(type="text", text=f"Error: {str(e)}"),)
 
 
 def determine_method(query: str) -> str:
@@ -442,20 +789,20 @@ def determine_method(query: str) -> str:
     Returns:
         The appropriate method: "target_code" for numeric IDs, "word_info" for words
     """
-    # Check if query contains only digits
-    if query.isdigit():
+    # Check if query contains only ASCII digits; isascii() rejects Hangul before any digit lookup
+    if query.isascii() and query.isdigit():
         return "target_code"
     else:
         return "word_info"
 
 
 @mcp.tool()
-def detail(
+async def detail(
     query: str,
-    api_key: str = API_KEY,
-    method: str = None,
-    req_type: str = "json",
-) -> list[types.TextContent | types.ImageContent]:
+    api_key: str | None = None,
+    method: DetailMethod | None = None,
+    req_type: ReqType = "json",
+) -> tuple[types.TextContent, ...]:
     """
     Get detailed information about a Dictionary entry
 
@@ -520,35 +867,107 @@ def detail(
             </tbody>
         </table>
     """
+    # Resolve the key on first use rather than at import
+    if api_key is None:
+        api_key = get_api_key()
+
     # Auto-determine method if not specified
     if method is None:
         method = determine_method(query)
 
     # Validate method parameter
-    if method not in ["word_info", "target_code"]:
-        return [types.TextContent(type="text", text="Error: Invalid method value. Must be 'word_info' or 'target_code'")]
+    if method not in _VALID_METHODS:
+        return _ERR_BAD_METHOD
 
     # Validate req_type parameter
-    if req_type not in ["json", "xml"]:
-        return [types.TextContent(type="text", text="Error: Invalid req_type value. Must be 'json' or 'xml'")]
+    if req_type not in _VALID_REQ_TYPES:
+        return _ERR_BAD_REQ_TYPE
 
-    params = {
-        "key": api_key,
-        "method": method,
-        "req_type": req_type,
-        "q": query,
-        "type_search": "view"
-    }
+    params = [
+        ("method", method),
+        ("req_type", req_type),
+        ("q", query),
+    ]
 
     try:
-        response = requests.get(VIEW_API_URL, params=params)
-        response.raise_for_status()
+        text = await _get(VIEW_API_URL, api_key, params)
 
-        # Return the original response as text
-        return [types.TextContent(type="text", text=response.text)]
+        # Return the response body; JSON bodies come back re-serialized without whitespace
+        return (types.TextContent(type="text", text=text),)
 
     except Exception as e:
-        return [types.TextContent(type="text", text=f"Error: {str(e)}")]
+        return (types.TextContent(type="text", text=f"Error: {str(e)}"),)
+
+
+async def _gather_contents(coros) -> tuple[types.TextContent, ...]:
+    """
+    Run tool coroutines concurrently and flatten their contents in input order
+
+    Args:
+        coros: Coroutines returning tool contents
+
+    Returns:
+        The contents of every coroutine, in the order they were given
+    """
+    async def bounded(coro):
+        async with _bulk_semaphore:
+            return await coro
+
+    results = await asyncio.gather(*(bounded(coro) for coro in coros), return_exceptions=True)
+
+    contents = []
+    for result in results:
+        if isinstance(result, Exception):
+            contents.append(types.TextContent(type="text", text=f"Error: {str(result)}"))
+        else:
+            contents.extend(result)
+    return tuple(contents)
+
+
+@mcp.tool()
+async def search_many(
+    queries: list[str],
+    api_key: str | None = None,
+    req_type: ReqType = "json",
+    start: Start = 1,
+    num: Num = 10,
+) -> tuple[types.TextContent, ...]:
+    """
+    Search the Dictionary for several words at once
+
+    Args:
+        queries: The search terms, one result is returned per term in the same order
+        api_key: Same as search
+        req_type: Same as search
+        start: Same as search
+        num: Same as search
+    """
+    return await _gather_contents(
+        search(query, api_key=api_key, req_type=req_type, start=start, num=num)
+        for query in queries
+    )
+
+
+@mcp.tool()
+async def detail_many(
+    queries: list[str],
+    api_key: str | None = None,
+    method: DetailMethod | None = None,
+    req_type: ReqType = "json",
+) -> tuple[types.TextContent, ...]:
+    """
+    Get detailed information about several Dictionary entries at once
+
+    Args:
+        queries: The search terms or target codes, one result is returned per query in the same order
+        api_key: Same as detail
+        method: Same as detail, determined per query if not specified
+        req_type: Same as detail
+    """
+    return await _gather_contents(
+        detail(query, api_key=api_key, method=method, req_type=req_type)
+        for query in queries
+    )
 
 
 if __name__ == "__main__":
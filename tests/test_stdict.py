@@ -0,0 +1,339 @@
+import asyncio
+import logging
+from collections import OrderedDict
+
+import httpx
+import pytest
+
+import stdict
+
+ERROR_BODY = '{"error": {"error_code": "020", "message": "등록되지 않은 인증 키입니다."}}'
+
+
+@pytest.fixture(autouse=True)
+def fresh_state(monkeypatch):
+    monkeypatch.setattr(stdict, "_response_cache", OrderedDict())
+    monkeypatch.setattr(stdict, "_response_cache_chars", 0)
+    monkeypatch.setattr(stdict, "_inflight", {})
+    monkeypatch.setattr(stdict, "_client", None)
+    monkeypatch.setattr(stdict, "_RETRY_BACKOFF", 0)
+    # A semaphore binds to the first event loop that waits on it, and each test runs its own
+    monkeypatch.setattr(stdict, "_bulk_semaphore", asyncio.Semaphore(stdict._BULK_CONCURRENCY))
+
+
+def use_transport(handler) -> list[httpx.Request]:
+    """Route the shared client through a mock transport, returning the requests it sees"""
+    requests = []
+
+    async def record(request):
+        requests.append(request)
+        result = handler(request)
+        return await result if asyncio.iscoroutine(result) else result
+
+    stdict._client = httpx.AsyncClient(transport=httpx.MockTransport(record))
+    return requests
+
+
+def text_of(contents) -> str:
+    (content,) = contents
+    return content.text
+
+
+def test_error_body_is_not_shared_between_keys():
+    def handler(request):
+        if request.url.params["key"] == "bad":
+            return httpx.Response(200, text=ERROR_BODY)
+        return httpx.Response(200, text='{"channel": {"total": 1}}')
+
+    requests = use_transport(handler)
+
+    async def run():
+        bad = text_of(await stdict.search("나무", api_key="bad"))
+        good = text_of(await stdict.search("나무", api_key="good"))
+        return bad, good
+
+    bad, good = asyncio.run(run())
+    assert '"error_code":"020"' in bad
+    assert good == '{"channel":{"total":1}}'
+    assert len(requests) == 2
+
+
+def test_xml_error_body_is_not_cached():
+    body = '<?xml version="1.0" encoding="UTF-8"?>\n<error><error_code>020</error_code></error>'
+    requests = use_transport(lambda request: httpx.Response(200, text=body))
+
+    async def run():
+        await stdict.detail("나무", api_key="bad", req_type="xml")
+        return text_of(await stdict.detail("나무", api_key="bad", req_type="xml"))
+
+    assert asyncio.run(run()) == body
+    assert len(requests) == 2
+    assert not stdict._response_cache
+
+
+def test_fresh_response_is_served_without_a_request():
+    requests = use_transport(
+        lambda request: httpx.Response(200, text='{"a": 1}', headers={"Cache-Control": "max-age=600"})
+    )
+
+    async def run():
+        first = text_of(await stdict.search("나무", api_key="k"))
+        second = text_of(await stdict.search("나무", api_key="k"))
+        return first, second
+
+    assert asyncio.run(run()) == ('{"a":1}', '{"a":1}')
+    assert len(requests) == 1
+
+
+def test_no_cache_response_is_revalidated_with_etag():
+    def handler(request):
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304, headers={"Cache-Control": "no-cache"})
+        return httpx.Response(200, text='{"a": 1}', headers={"ETag": '"v1"', "Cache-Control": "no-cache"})
+
+    requests = use_transport(handler)
+
+    async def run():
+        await stdict.search("나무", api_key="k")
+        return text_of(await stdict.search("나무", api_key="k"))
+
+    assert asyncio.run(run()) == '{"a":1}'
+    assert len(requests) == 2
+    assert "If-None-Match" not in requests[0].headers
+    assert requests[1].headers["If-None-Match"] == '"v1"'
+
+
+def test_no_store_response_is_not_cached():
+    requests = use_transport(
+        lambda request: httpx.Response(200, text='{"a": 1}', headers={"Cache-Control": "no-store", "ETag": '"v1"'})
+    )
+
+    async def run():
+        await stdict.search("나무", api_key="k")
+        await stdict.search("나무", api_key="k")
+
+    asyncio.run(run())
+    assert len(requests) == 2
+    assert "If-None-Match" not in requests[1].headers
+    assert not stdict._response_cache
+
+
+def test_concurrent_identical_calls_share_one_request():
+    async def handler(request):
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, text='{"a": 1}', headers={"Cache-Control": "no-store"})
+
+    requests = use_transport(handler)
+
+    async def run():
+        return await asyncio.gather(
+            stdict.search("나무", api_key="k"),
+            stdict.search("나무", api_key="k"),
+            stdict.search("바다", api_key="k"),
+        )
+
+    results = asyncio.run(run())
+    assert [text_of(result) for result in results] == ['{"a":1}'] * 3
+    assert len(requests) == 2
+    assert not stdict._inflight
+
+
+def test_concurrent_calls_with_different_keys_are_not_merged():
+    async def handler(request):
+        await asyncio.sleep(0.05)
+        if request.url.params["key"] == "bad":
+            return httpx.Response(200, text=ERROR_BODY)
+        return httpx.Response(200, text='{"a": 1}')
+
+    requests = use_transport(handler)
+
+    async def run():
+        return await asyncio.gather(
+            stdict.search("나무", api_key="bad"),
+            stdict.search("나무", api_key="good"),
+        )
+
+    bad, good = asyncio.run(run())
+    assert '"error_code":"020"' in text_of(bad)
+    assert text_of(good) == '{"a":1}'
+    assert len(requests) == 2
+
+
+def test_stale_response_without_validators_is_refetched():
+    requests = use_transport(
+        lambda request: httpx.Response(200, text='{"a": 1}', headers={"Cache-Control": "max-age=0"})
+    )
+
+    async def run():
+        await stdict.search("나무", api_key="k")
+        await stdict.search("나무", api_key="k")
+
+    asyncio.run(run())
+    assert len(requests) == 2
+    assert "If-None-Match" not in requests[1].headers
+
+
+def test_revalidated_response_is_fresh_again():
+    def handler(request):
+        if request.headers.get("If-Modified-Since"):
+            return httpx.Response(304, headers={"Cache-Control": "max-age=600"})
+        return httpx.Response(
+            200,
+            text='{"a": 1}',
+            headers={"Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT", "Cache-Control": "no-cache"},
+        )
+
+    requests = use_transport(handler)
+
+    async def run():
+        for _ in range(3):
+            assert text_of(await stdict.search("나무", api_key="k")) == '{"a":1}'
+
+    asyncio.run(run())
+    assert len(requests) == 2
+    assert requests[1].headers["If-Modified-Since"] == "Wed, 01 Jan 2025 00:00:00 GMT"
+
+
+def test_304_without_cache_control_keeps_the_stored_no_cache():
+    def handler(request):
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304, headers={"ETag": '"v1"'})
+        return httpx.Response(200, text='{"a": 1}', headers={"ETag": '"v1"', "Cache-Control": "no-cache"})
+
+    requests = use_transport(handler)
+
+    async def run():
+        for _ in range(4):
+            assert text_of(await stdict.search("나무", api_key="k")) == '{"a":1}'
+
+    asyncio.run(run())
+    assert len(requests) == 4
+    assert all(request.headers["If-None-Match"] == '"v1"' for request in requests[1:])
+
+def test_cache_evicts_least_recently_used_past_size_cap(monkeypatch):
+    monkeypatch.setattr(stdict, "_RESPONSE_CACHE_MAX_CHARS", 20)
+
+    stdict._cache_response("a", stdict._CachedResponse(0.0, 0.0, None, None, "x" * 10))
+    stdict._cache_response("b", stdict._CachedResponse(0.0, 0.0, None, None, "x" * 10))
+    stdict._cache_response("a", stdict._CachedResponse(0.0, 0.0, None, None, "x" * 5))
+    assert stdict._response_cache_chars == 15
+
+    stdict._cache_response("c", stdict._CachedResponse(0.0, 0.0, None, None, "x" * 10))
+    assert list(stdict._response_cache) == ["a", "c"]
+    assert stdict._response_cache_chars == 15
+
+    stdict._drop_response("a")
+    stdict._drop_response("missing")
+    assert list(stdict._response_cache) == ["c"]
+    assert stdict._response_cache_chars == 10
+
+
+def test_api_key_is_not_logged(caplog):
+    use_transport(lambda request: httpx.Response(200, text='{"a": 1}'))
+
+    with caplog.at_level(logging.DEBUG):
+        asyncio.run(stdict.search("나무", api_key="secret-key-123"))
+
+    assert not any("secret-key-123" in record.getMessage() for record in caplog.records)
+
+
+def test_api_key_is_masked_when_httpx_logging_is_enabled(caplog):
+    use_transport(lambda request: httpx.Response(200, text='{"a": 1}'))
+
+    with caplog.at_level(logging.INFO, logger="httpx"):
+        asyncio.run(stdict.search("나무", api_key="secret-key-123"))
+
+    messages = [record.getMessage() for record in caplog.records if record.name == "httpx"]
+    assert any("key=***&" in message for message in messages)
+    assert not any("secret-key-123" in message for message in messages)
+
+
+def test_transient_server_errors_are_retried():
+    statuses = iter((503, 502))
+    requests = use_transport(lambda request: httpx.Response(next(statuses, 200), text='{"a": 1}'))
+
+    assert text_of(asyncio.run(stdict.search("나무", api_key="k"))) == '{"a":1}'
+    assert len(requests) == 3
+
+
+def test_server_error_is_returned_once_retries_run_out():
+    requests = use_transport(lambda request: httpx.Response(500))
+
+    assert text_of(asyncio.run(stdict.search("나무", api_key="k"))).startswith("Error: ")
+    assert len(requests) == stdict._RETRIES + 1
+
+
+def test_client_errors_are_not_retried():
+    requests = use_transport(lambda request: httpx.Response(404))
+
+    assert text_of(asyncio.run(stdict.search("나무", api_key="k"))).startswith("Error: ")
+    assert len(requests) == 1
+
+
+def test_search_many_keeps_input_order():
+    delays = {"가": 0.06, "나": 0.0, "다": 0.03}
+
+    async def handler(request):
+        query = request.url.params["q"]
+        await asyncio.sleep(delays[query])
+        return httpx.Response(200, text=f'{{"q": "{query}"}}')
+
+    use_transport(handler)
+
+    contents = asyncio.run(stdict.search_many(["가", "나", "다"], api_key="k"))
+    assert [content.text for content in contents] == ['{"q":"가"}', '{"q":"나"}', '{"q":"다"}']
+
+
+def test_search_many_reports_a_failing_query_in_place():
+    def handler(request):
+        if request.url.params["q"] == "나":
+            return httpx.Response(404)
+        return httpx.Response(200, text='{"a": 1}')
+
+    use_transport(handler)
+
+    contents = asyncio.run(stdict.search_many(["가", "나", "다"], api_key="k"))
+    assert [content.text.startswith("Error: ") for content in contents] == [False, True, False]
+
+
+def test_search_many_turns_exceptions_into_error_entries(monkeypatch):
+    original_search = stdict.search
+
+    async def search(query, **kwargs):
+        if query == "나":
+            raise RuntimeError("boom")
+        return await original_search(query, **kwargs)
+
+    monkeypatch.setattr(stdict, "search", search)
+    use_transport(lambda request: httpx.Response(200, text='{"a": 1}'))
+
+    contents = asyncio.run(stdict.search_many(["가", "나"], api_key="k"))
+    assert [content.text for content in contents] == ['{"a":1}', "Error: boom"]
+
+
+def test_bulk_tools_cap_requests_in_flight():
+    in_flight = 0
+    peak = 0
+
+    async def handler(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.02)
+        in_flight -= 1
+        return httpx.Response(200, text='{"a": 1}')
+
+    requests = use_transport(handler)
+
+    contents = asyncio.run(stdict.search_many([f"단어{i}" for i in range(50)], api_key="k"))
+    assert len(contents) == 50
+    assert len(requests) == 50
+    assert peak == stdict._BULK_CONCURRENCY
+
+
+def test_detail_many_picks_the_method_per_query():
+    requests = use_transport(lambda request: httpx.Response(200, text='{"a": 1}'))
+
+    asyncio.run(stdict.detail_many(["나무", "12345"], api_key="k"))
+    methods = {request.url.params["q"]: request.url.params["method"] for request in requests}
+    assert methods == {"나무": "word_info", "12345": "target_code"}